@@ -12,18 +12,60 @@ __copyright__ = "Copyright (c) 2020, Jacob Moorman"
 
 
 from ._abc import Base
-from ._variants import (  # OrthogonalMaxDistance,
-    Cyclic,
-    MaxDistance,
-    MaxDistanceLookahead,
-    Nonrepetitive,
-    ParallelOrthoUpdate,
-    Quantile,
-    Random,
-    RandomOrthoGraph,
-    RelaxedGreedy,
-    SampledQuantile,
-    SVRandom,
-    UniformRandom,
-    WindowedQuantile,
+
+# The selection strategies are loaded lazily (PEP 562) so that
+# ``import kaczmarz`` does not pay for strategies that are never used.
+_VARIANTS = (  # OrthogonalMaxDistance,
+    "Block",
+    "BlockAveraged",
+    "BlockCyclic",
+    "Cyclic",
+    "MaxDistance",
+    "MaxDistanceLookahead",
+    "Nonrepetitive",
+    "ParallelOrthoUpdate",
+    "Quantile",
+    "Random",
+    "RandomOrthoGraph",
+    "RelaxedGreedy",
+    "SampledQuantile",
+    "SVRandom",
+    "UniformRandom",
+    "WindowedQuantile",
 )
+
+__all__ = ["Base", "strategies", *_VARIANTS]
+
+_strategies = None
+
+
+def strategies():
+    """Return a read-only mapping of selection strategy names to classes.
+
+    The mapping is built once on first use and cached,
+    so repeated name-based lookups cost a single dict access.
+    """
+    global _strategies
+    if _strategies is None:
+        from types import MappingProxyType
+
+        from . import _variants
+
+        _strategies = MappingProxyType(
+            {name: getattr(_variants, name) for name in _VARIANTS}
+        )
+    return _strategies
+
+
+def __getattr__(name):
+    if name in _VARIANTS:
+        from . import _variants
+
+        variant = getattr(_variants, name)
+        globals()[name] = variant
+        return variant
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VARIANTS))
@@ -1,9 +1,17 @@
+import warnings
 from abc import ABC, abstractmethod
+from collections import deque
 
 import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import get_blas_funcs
 
+from ._kernels import csr_matvec, csr_row_dot, dense_update, sparse_update
 from ._normalize import normalize_system
 
+# Largest Gramian, in bytes, that residual tracking is allowed to cache.
+_GRAMIAN_MEMORY_BUDGET = 2 ** 29  # 512 MB
+
 
 class Base(ABC):
     """A base class for the Kaczmarz algorithm.
@@ -25,17 +33,44 @@ class Base(ABC):
         Tolerance for convergence, ``norm(normalized_residual) <= tol``. Pass ``None`` to ignore the tolerance.
     maxiter : int or float, optional
         Maximum number of iterations. At least one of ``tol`` or ``maxiter`` must be passed.
+    check_every : int, optional
+        Number of iterations between checks of ``tol`` against the residual norm.
+        Each check costs a full matrix-vector product, which dwarfs the cost
+        of a single row projection, so checking less often can substantially
+        reduce the per-iteration overhead on tall systems.
     callback : function, optional
         User-supplied function to call after each iteration.
         It is called as ``callback(xk)``,
         where xk is the current solution vector.
+    seed : None, int, or numpy.random.Generator, optional
+        Seed for the generator used by randomized selection strategies.
+    copy_iterates : bool, optional
+        Whether produced iterates are independent copies of the internal
+        buffer. Pass False to save one length-n copy per iteration, in
+        which case each produced iterate aliases the internal buffer and
+        is overwritten by the next iteration.
+    dtype : numpy dtype, optional
+        Storage type for the normalized system, float64 by default.
+        float32 halves the memory traffic of each iteration and suffices
+        for well-conditioned systems with modest tolerances.
 
     Notes
     -----
     There may be additional parameters not listed above
     depending on the selection strategy subclass.
+
+    The normalized system is stored with rows contiguous in memory:
+    dense matrices are copied once into C-contiguous float64 storage and
+    sparse matrices are converted to CSR format, so that the row accessed
+    at each iteration is a stride-1 slice.
     """
 
+    # Subclasses whose row selection needs the residual every iteration
+    # set this to True. The residual is then maintained incrementally in
+    # O(m) per step using a row of the cached Gramian, instead of being
+    # recomputed with an O(mn) matrix-vector product.
+    _track_residual = False
+
     def __init__(
         self,
         A,
@@ -43,18 +78,40 @@ class Base(ABC):
         x0=None,
         tol=1e-5,
         maxiter=None,
+        check_every=1,
         callback=None,
+        seed=None,
+        copy_iterates=True,
+        dtype=np.float64,
     ):
-        self._A, self._b, self._row_norms = normalize_system(A, b)
+        if np.dtype(dtype) == np.float32 and tol is not None and tol < 1e-4:
+            warnings.warn(
+                "tol=%g may be unattainable with float32 storage." % tol,
+                stacklevel=2,
+            )
+        self._A, self._b, self._row_norms = normalize_system(A, b, dtype=dtype)
+        if sp.issparse(self._A):
+            # CSR makes each row a contiguous slice of the data/indices arrays.
+            self._A = sp.csr_matrix(self._A)
+            self._apply_update = self._apply_sparse_update
+            self._row_dot = self._sparse_row_dot
+        else:
+            self._apply_update = self._apply_dense_update
+            self._row_dot = self._dense_row_dot
+        self._row_norms_sq = np.ascontiguousarray(
+            self._row_norms ** 2, dtype=np.float64
+        )
         self._n_rows = len(self._b)
 
         if x0 is None:
             n_cols = self._A.shape[1]
-            x0 = np.zeros(n_cols)
+            x0 = np.zeros(n_cols, dtype=self._A.dtype)
             self._iterate_shape = list(np.shape(b))  # [m,] or [m, 1]
             self._iterate_shape[0] = n_cols
         else:
-            x0 = np.array(x0, dtype="float64")
+            # No copy when x0 already has the storage dtype.
+            # The iteration copies x0 before updating it in place.
+            x0 = np.asarray(x0, dtype=self._A.dtype)
             self._iterate_shape = x0.shape
         self._x0 = x0.ravel()
 
@@ -71,7 +128,12 @@ class Base(ABC):
                 )
         self._tol = tol
         self._maxiter = maxiter
+        self._check_every = check_every
+        # PCG64 is considerably faster per draw than the legacy global state.
+        self._rng = np.random.default_rng(seed)
+        self._copy_iterates = copy_iterates
 
+        self._has_user_callback = callback is not None
         if callback is None:
 
             def callback(xk):
@@ -79,10 +141,34 @@ class Base(ABC):
 
         self._callback = callback
 
+        self._gramian = None
+        self._rk = None
+        if self._track_residual:
+            gramian_bytes = self._A.dtype.itemsize * self._n_rows * self._n_rows
+            if gramian_bytes <= _GRAMIAN_MEMORY_BUDGET:
+                if sp.issparse(self._A):
+                    gramian = (self._A @ self._A.T).toarray()
+                else:
+                    # syrk exploits the symmetry of A @ A.T, computing one
+                    # triangle in half the flops of the gemm behind ``@``.
+                    syrk = get_blas_funcs("syrk", (self._A,))
+                    gramian = syrk(1.0, self._A, lower=1)
+                    i_upper = np.triu_indices(self._n_rows, 1)
+                    gramian[i_upper] = gramian.T[i_upper]
+                self._gramian = np.ascontiguousarray(gramian)
+                self._rk = self._b - self._A @ self._x0
+
         self._k = -1
         self._ik = -1
         self._xk = None
 
+        # The squared residual norm from the most recent tolerance check.
+        # Valid until the next projection dirties it.
+        self._last_residual_norm_sq = None
+        self._residual_dirty = True
+        # Scratch buffer for residual computations in the stopping criterion.
+        self._residual_buffer = np.empty(self._n_rows, dtype=self._A.dtype)
+
     @property
     def ik(self):
         """int: The index of the row used on the most recent iteration.
@@ -96,7 +182,9 @@ class Base(ABC):
 
         The shape will match that of ``x0`` if provided, or ``b`` otherwise.
         """
-        return self._xk.copy().reshape(*self._iterate_shape)
+        if self._copy_iterates:
+            return self._xk.copy().reshape(*self._iterate_shape)
+        return self._xk.reshape(*self._iterate_shape)
 
     @classmethod
     def iterates(cls, *base_args, **base_kwargs):
@@ -155,9 +243,47 @@ class Base(ABC):
             or ``b`` otherwise.
         """
         iterates = cls.iterates(*base_args, **base_kwargs)
-        for x in iterates:
-            pass
-        return x
+        if not iterates._has_user_callback:
+            # The intermediate iterates are discarded,
+            # so the defensive copy in the xk property is wasted.
+            iterates._copy_iterates = False
+        # Drain the iterator at C speed instead of a Python for-loop.
+        deque(iterates, maxlen=0)
+        return iterates.xk
+
+    @classmethod
+    def solve_batch(cls, A, B, *base_args, **base_kwargs):
+        """Solve ``A @ X = B`` for every column of ``B``, sharing ``A``.
+
+        Note
+        ----
+        Apart from ``B`` taking the place of ``b``,
+        this method takes the same parameters as :class:`kaczmarz.Base`
+        or the subclass from which it is called.
+
+        Parameters
+        ----------
+        A : (m, n) spmatrix or array_like
+            The m-by-n matrix of the linear systems.
+        B : (m, k) array_like
+            The k right hand sides, one per column.
+        base_args : tuple
+            Additional positional arguments for :class:`kaczmarz.Base`
+            constructor or the subclass in use.
+        base_kwargs : dict
+            Keyword arguments for :class:`kaczmarz.Base` constructor
+            or the subclass in use.
+
+        Returns
+        -------
+        X : (n, k) array
+            Solutions to the systems ``A @ X[:, i] = B[:, i]``.
+        """
+        B = np.asarray(B, dtype=np.float64)
+        columns = [
+            cls.solve(A, B[:, i], *base_args, **base_kwargs) for i in range(B.shape[1])
+        ]
+        return np.stack(columns, axis=1)
 
     def __next__(self):
         """Perform an iteration of the Kaczmarz algorithm.
@@ -171,7 +297,8 @@ class Base(ABC):
         """
         if self._k == -1:
             self._k += 1
-            self._xk = self._x0
+            # Copy so that repeated in-place updates never touch the user's ``x0``.
+            self._xk = self._x0.copy()
             self._callback(self.xk)
             return self.xk
 
@@ -182,6 +309,7 @@ class Base(ABC):
         self._ik = self._select_row_index(self._xk)
         if self._ik != -1:
             self._xk = self._update_iterate(self._xk, self._ik)
+            self._residual_dirty = True
 
         self._callback(self.xk)
 
@@ -219,11 +347,57 @@ class Base(ABC):
         Returns
         -------
         xkp1 : (n,) array
-            The next iterate
+            The next iterate.
+            ``xk`` is updated in place and returned
+            to avoid allocating a fresh iterate every step.
+        """
+        scale = self._apply_update(xk, ik)
+        if self._rk is not None:
+            # Rows have unit norm, so A @ A[ik] is exactly a Gramian row.
+            self._rk -= scale * self._gramian[ik]
+        return xk
+
+    def _residual(self, xk):
+        """Compute ``b - A @ xk`` into the shared scratch buffer.
+
+        Writing through ``out=`` avoids the temporary that
+        ``self._b - self._A @ xk`` would allocate on every call.
+        The returned buffer is overwritten by the next call.
+        """
+        if sp.issparse(self._A):
+            csr_matvec(
+                self._A.data,
+                self._A.indices,
+                self._A.indptr,
+                xk,
+                self._residual_buffer,
+            )
+        else:
+            np.dot(self._A, xk, out=self._residual_buffer)
+        np.subtract(self._b, self._residual_buffer, out=self._residual_buffer)
+        return self._residual_buffer
+
+    def _dense_row_dot(self, ik, xk):
+        """Inner product of dense row ``ik`` with ``xk``."""
+        return np.dot(self._A[ik], xk)
+
+    def _sparse_row_dot(self, ik, xk):
+        """Inner product of CSR row ``ik`` with ``xk``.
+
+        Works on the CSR arrays directly, unlike ``self._A[ik] @ xk``,
+        which allocates a fresh 1-by-n sparse matrix for every call.
         """
-        ai = self._A[ik]
-        bi = self._b[ik]
-        return xk + (bi - ai @ xk) * ai
+        return csr_row_dot(self._A.data, self._A.indices, self._A.indptr, ik, xk)
+
+    def _apply_dense_update(self, xk, ik):
+        """In-place projection of ``xk`` onto dense row ``ik``."""
+        return dense_update(self._A, self._b, xk, ik)
+
+    def _apply_sparse_update(self, xk, ik):
+        """In-place projection of ``xk`` onto CSR row ``ik``."""
+        return sparse_update(
+            self._A.data, self._A.indices, self._A.indptr, self._b, xk, ik
+        )
 
     def _stopping_criterion(self, k, xk):
         """Check if the iteration should terminate.
@@ -243,11 +417,20 @@ class Base(ABC):
         if self._k >= self._maxiter:
             return True
 
-        if self._tol is not None:
-            residual = self._b - self._A @ xk
-            residual_norm = np.linalg.norm(residual)
-
-            if residual_norm < self._tol:
+        if self._tol is not None and k % self._check_every == 0:
+            if not self._residual_dirty and self._last_residual_norm_sq is not None:
+                # Skipped projections leave the residual untouched,
+                # e.g. when Quantile rejects the sampled row.
+                residual_norm_sq = self._last_residual_norm_sq
+            else:
+                residual = self._rk if self._rk is not None else self._residual(xk)
+                # One fused ddot pass; squaring elementwise and summing
+                # would allocate a temporary and stream the vector twice.
+                residual_norm_sq = np.dot(residual, residual)
+            self._last_residual_norm_sq = residual_norm_sq
+            self._residual_dirty = False
+
+            if residual_norm_sq < self._tol * self._tol:
                 return True
 
         return False
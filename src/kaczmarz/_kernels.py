@@ -0,0 +1,34 @@
+"""Numerical kernels for the hot loop of the Kaczmarz algorithm.
+
+The kernels are compiled with numba when it is available.
+Otherwise, they fall back to vectorized numpy implementations.
+"""
+
+try:
+    from ._kernels_numba import (
+        abs_residuals,
+        argmax_abs,
+        block_averaged_step,
+        csr_matvec,
+        csr_row_dot,
+        cyclic_loop,
+        dense_update,
+        greedy_probs,
+        lookahead_cost,
+        maxdistance_loop,
+        sparse_update,
+    )
+except ImportError:
+    from ._kernels_numpy import (
+        abs_residuals,
+        argmax_abs,
+        block_averaged_step,
+        csr_matvec,
+        csr_row_dot,
+        cyclic_loop,
+        dense_update,
+        greedy_probs,
+        lookahead_cost,
+        maxdistance_loop,
+        sparse_update,
+    )
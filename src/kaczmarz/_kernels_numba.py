@@ -0,0 +1,407 @@
+"""Numba-compiled kernels for the hot loop of the Kaczmarz algorithm.
+
+Importing this module requires numba; :mod:`kaczmarz._kernels` falls
+back to :mod:`kaczmarz._kernels_numpy` when it is unavailable.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(fastmath=True, cache=True)
+def dense_update(A, b, xk, ik):
+    """Project ``xk`` onto the hyperplane of row ``ik``, in place.
+
+    The rows of ``A`` are assumed to have unit norm.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate. Updated in place.
+    ik : int
+        Row index to use for the update.
+
+    Returns
+    -------
+    scale : float
+        Coefficient of the projection, ``b[ik] - A[ik] @ xk``.
+    """
+    n_cols = A.shape[1]
+    dot = 0.0
+    for j in range(n_cols):
+        dot += A[ik, j] * xk[j]
+    scale = b[ik] - dot
+    for j in range(n_cols):
+        xk[j] += scale * A[ik, j]
+    return scale
+
+
+@njit(fastmath=True, cache=True)
+def sparse_update(data, indices, indptr, b, xk, ik):
+    """Project ``xk`` onto the hyperplane of CSR row ``ik``, in place.
+
+    The rows of the CSR matrix are assumed to have unit norm.
+
+    Parameters
+    ----------
+    data : (nnz,) array
+        CSR data array of the normalized matrix.
+    indices : (nnz,) array
+        CSR column index array of the normalized matrix.
+    indptr : (m + 1,) array
+        CSR row pointer array of the normalized matrix.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate. Updated in place.
+    ik : int
+        Row index to use for the update.
+
+    Returns
+    -------
+    scale : float
+        Coefficient of the projection, ``b[ik] - A[ik] @ xk``.
+    """
+    start = indptr[ik]
+    end = indptr[ik + 1]
+    dot = 0.0
+    for jj in range(start, end):
+        dot += data[jj] * xk[indices[jj]]
+    scale = b[ik] - dot
+    for jj in range(start, end):
+        xk[indices[jj]] += scale * data[jj]
+    return scale
+
+
+@njit(fastmath=True, cache=True)
+def cyclic_loop(A, b, xk, order, tol, maxiter, check_every):
+    """Run dense cyclic Kaczmarz sweeps until convergence, in place.
+
+    The rows of ``A`` are assumed to have unit norm.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The starting iterate. Updated in place.
+    order : (m,) array
+        Row indices in the order they should be cycled through.
+    tol : float
+        Residual norm below which to stop. Negative to never stop early.
+    maxiter : float
+        Maximum number of iterations.
+    check_every : int
+        Number of iterations between residual checks.
+
+    Returns
+    -------
+    k : int
+        The number of iterations performed.
+    """
+    n_rows, n_cols = A.shape
+    n_order = order.shape[0]
+    k = 0
+    while k < maxiter:
+        if tol >= 0.0 and k % check_every == 0:
+            norm_sq = 0.0
+            for i in range(n_rows):
+                dot = 0.0
+                for j in range(n_cols):
+                    dot += A[i, j] * xk[j]
+                residual = b[i] - dot
+                norm_sq += residual * residual
+            if norm_sq ** 0.5 < tol:
+                break
+        ik = order[k % n_order]
+        dot = 0.0
+        for j in range(n_cols):
+            dot += A[ik, j] * xk[j]
+        scale = b[ik] - dot
+        for j in range(n_cols):
+            xk[j] += scale * A[ik, j]
+        k += 1
+    return k
+
+
+@njit(fastmath=True, cache=True)
+def csr_row_dot(data, indices, indptr, ik, x):
+    """Compute ``A[ik] @ x`` for a CSR matrix, without slicing the row.
+
+    Parameters
+    ----------
+    data : (nnz,) array
+        CSR data array.
+    indices : (nnz,) array
+        CSR column index array.
+    indptr : (m + 1,) array
+        CSR row pointer array.
+    ik : int
+        Row index to use.
+    x : (n,) array
+        Vector to multiply.
+
+    Returns
+    -------
+    dot : float
+        The inner product of row ``ik`` with ``x``.
+    """
+    dot = 0.0
+    for jj in range(indptr[ik], indptr[ik + 1]):
+        dot += data[jj] * x[indices[jj]]
+    return dot
+
+
+@njit(fastmath=True, cache=True)
+def csr_matvec(data, indices, indptr, x, out):
+    """Compute ``A @ x`` into ``out`` for a CSR matrix.
+
+    Avoids the per-call Python dispatch of scipy's ``@``,
+    which dominates for the small matvecs issued every iteration.
+
+    Parameters
+    ----------
+    data : (nnz,) array
+        CSR data array.
+    indices : (nnz,) array
+        CSR column index array.
+    indptr : (m + 1,) array
+        CSR row pointer array.
+    x : (n,) array
+        Vector to multiply.
+    out : (m,) array
+        Output buffer for the product.
+    """
+    n_rows = indptr.shape[0] - 1
+    for i in range(n_rows):
+        dot = 0.0
+        for jj in range(indptr[i], indptr[i + 1]):
+            dot += data[jj] * x[indices[jj]]
+        out[i] = dot
+
+
+@njit(fastmath=True, cache=True)
+def greedy_probs(residual, row_norms_sq, fro_sq, theta, prob):
+    """Write the relaxed-greedy sampling probabilities into ``prob``.
+
+    Fuses the squaring, weighting, thresholding and normalization of
+    Bai and Wu's index set into two passes over the residual.
+
+    Parameters
+    ----------
+    residual : (m,) array
+        The current residual ``b - A @ xk``.
+    row_norms_sq : (m,) array
+        Squared norms of the original (unnormalized) rows of ``A``.
+    fro_sq : float
+        Squared Frobenius norm of the original ``A``.
+    theta : float
+        Relaxation parameter in the range [0, 1].
+    prob : (m,) array
+        Output buffer for the sampling probabilities.
+
+    Returns
+    -------
+    total : float
+        Total unnormalized probability mass. Zero if no row passed
+        the threshold.
+    """
+    m = residual.shape[0]
+    res_norm_sq = 0.0
+    for i in range(m):
+        weighted = row_norms_sq[i] * residual[i] * residual[i]
+        prob[i] = weighted
+        res_norm_sq += weighted
+    total = 0.0
+    for i in range(m):
+        r_sq = residual[i] * residual[i]
+        epsilon = theta / res_norm_sq * r_sq + (1.0 - theta) / fro_sq
+        if prob[i] >= epsilon * res_norm_sq * row_norms_sq[i]:
+            total += prob[i]
+        else:
+            prob[i] = 0.0
+    if total > 0.0:
+        for i in range(m):
+            prob[i] /= total
+    return total
+
+
+@njit(fastmath=True, cache=True)
+def argmax_abs(x):
+    """Index of the entry of ``x`` with the largest magnitude.
+
+    A single pass with no temporary,
+    unlike ``np.argmax(np.abs(x))`` which allocates and streams twice.
+
+    Parameters
+    ----------
+    x : (m,) array
+
+    Returns
+    -------
+    i : int
+        Index of the entry with the largest absolute value.
+    """
+    best_i = 0
+    best = abs(x[0])
+    for i in range(1, x.shape[0]):
+        value = abs(x[i])
+        if value > best:
+            best = value
+            best_i = i
+    return best_i
+
+
+@njit(fastmath=True, cache=True)
+def maxdistance_loop(A, b, xk, rk, gramian, tol, maxiter, check_every):
+    """Run dense max-distance (Motzkin) Kaczmarz until convergence, in place.
+
+    The rows of ``A`` are assumed to have unit norm,
+    and the residual is maintained incrementally with Gramian rows.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The starting iterate. Updated in place.
+    rk : (m,) array
+        The residual ``b - A @ xk`` of the starting iterate.
+        Updated in place.
+    gramian : (m, m) array
+        The Gramian ``A @ A.T`` of the normalized matrix.
+    tol : float
+        Residual norm below which to stop. Negative to never stop early.
+    maxiter : float
+        Maximum number of iterations.
+    check_every : int
+        Number of iterations between residual checks.
+
+    Returns
+    -------
+    k : int
+        The number of iterations performed.
+    """
+    n_rows, n_cols = A.shape
+    k = 0
+    while k < maxiter:
+        if tol >= 0.0 and k % check_every == 0:
+            norm_sq = 0.0
+            for i in range(n_rows):
+                norm_sq += rk[i] * rk[i]
+            if norm_sq ** 0.5 < tol:
+                break
+        ik = 0
+        best = abs(rk[0])
+        for i in range(1, n_rows):
+            value = abs(rk[i])
+            if value > best:
+                best = value
+                ik = i
+        scale = rk[ik]
+        for j in range(n_cols):
+            xk[j] += scale * A[ik, j]
+        for i in range(n_rows):
+            rk[i] -= scale * gramian[ik, i]
+        k += 1
+    return k
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def block_averaged_step(A, b, xk, idxs):
+    """Add the average of the row projections of ``idxs`` to ``xk``.
+
+    The rows of ``A`` are assumed to have unit norm.
+    The projection coefficients are computed in parallel against the
+    unmodified iterate, without gathering ``A[idxs]`` into a copy.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate. Updated in place.
+    idxs : (K,) array
+        Row indices of the block, possibly with repeats.
+    """
+    n_cols = A.shape[1]
+    n_idxs = idxs.shape[0]
+    coef = np.empty(n_idxs)
+    for k in prange(n_idxs):
+        ik = idxs[k]
+        dot = 0.0
+        for j in range(n_cols):
+            dot += A[ik, j] * xk[j]
+        coef[k] = (b[ik] - dot) / n_idxs
+    for k in range(n_idxs):
+        ik = idxs[k]
+        scale = coef[k]
+        for j in range(n_cols):
+            xk[j] += scale * A[ik, j]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def lookahead_cost(residual, residual_sq, gramian, gramian2, out):
+    """Fill the two-step lookahead cost matrix into ``out``.
+
+    Computes ``out[i, j] = r2[i] + r2[j] - 2 r[i] r[j] G[i, j]
+    + r2[i] G2[i, j]`` in a single pass. Every array is streamed
+    row-major, so each entry of the Gramians is read exactly once.
+
+    Parameters
+    ----------
+    residual : (m,) array
+        The current residual ``b - A @ xk``.
+    residual_sq : (m,) array
+        Elementwise square of ``residual``.
+    gramian : (m, m) array
+        The Gramian ``A @ A.T`` of the normalized matrix.
+    gramian2 : (m, m) array
+        Elementwise square of ``gramian``.
+    out : (m, m) array
+        Output buffer for the cost matrix.
+    """
+    n_rows = residual.shape[0]
+    for i in prange(n_rows):
+        r_i = residual[i]
+        r_sq_i = residual_sq[i]
+        for j in range(n_rows):
+            out[i, j] = (
+                r_sq_i
+                + residual_sq[j]
+                - 2.0 * r_i * residual[j] * gramian[i, j]
+                + r_sq_i * gramian2[i, j]
+            )
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def abs_residuals(A, b, xk, out):
+    """Compute ``abs(b - A @ xk)`` into ``out``, one row per thread.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate.
+    out : (m,) array
+        Output buffer for the absolute residuals.
+    """
+    n_rows, n_cols = A.shape
+    for i in prange(n_rows):
+        dot = 0.0
+        for j in range(n_cols):
+            dot += A[i, j] * xk[j]
+        out[i] = abs(b[i] - dot)
@@ -0,0 +1,252 @@
+"""Numpy fallbacks for the kernels of :mod:`kaczmarz._kernels_numba`.
+
+Used when numba is not installed. Vectorized where possible; whole-solve
+loop kernels are unavailable and are published as ``None``.
+"""
+
+import numpy as np
+from scipy.linalg import get_blas_funcs
+from scipy.sparse import csr_matrix
+
+# BLAS routines resolved per dtype. The double-precision daxpy/ddot
+# would silently cast float32 arrays to fresh float64 copies and
+# update those, leaving the iterate untouched.
+_blas_cache = {}
+
+
+def _dot_axpy(A):
+    funcs = _blas_cache.get(A.dtype.char)
+    if funcs is None:
+        funcs = get_blas_funcs(("dot", "axpy"), (A,))
+        _blas_cache[A.dtype.char] = funcs
+    return funcs
+
+
+def dense_update(A, b, xk, ik):
+    """Project ``xk`` onto the hyperplane of row ``ik``, in place.
+
+    The rows of ``A`` are assumed to have unit norm.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate. Updated in place.
+    ik : int
+        Row index to use for the update.
+
+    Returns
+    -------
+    scale : float
+        Coefficient of the projection, ``b[ik] - A[ik] @ xk``.
+    """
+    dot, axpy = _dot_axpy(A)
+    ai = A[ik]
+    scale = b[ik] - dot(ai, xk)
+    # In-place BLAS axpy, avoiding the temporary of ``xk += scale * ai``.
+    axpy(ai, xk, a=scale)
+    return scale
+
+
+def sparse_update(data, indices, indptr, b, xk, ik):
+    """Project ``xk`` onto the hyperplane of CSR row ``ik``, in place.
+
+    The rows of the CSR matrix are assumed to have unit norm.
+
+    Parameters
+    ----------
+    data : (nnz,) array
+        CSR data array of the normalized matrix.
+    indices : (nnz,) array
+        CSR column index array of the normalized matrix.
+    indptr : (m + 1,) array
+        CSR row pointer array of the normalized matrix.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate. Updated in place.
+    ik : int
+        Row index to use for the update.
+
+    Returns
+    -------
+    scale : float
+        Coefficient of the projection, ``b[ik] - A[ik] @ xk``.
+    """
+    cols = indices[indptr[ik] : indptr[ik + 1]]
+    vals = data[indptr[ik] : indptr[ik + 1]]
+    scale = b[ik] - vals @ xk[cols]
+    xk[cols] += scale * vals
+    return scale
+
+
+# Without numba, running whole solves in a compiled loop is unavailable
+# and callers fall back to the per-iteration Python path.
+cyclic_loop = None
+maxdistance_loop = None
+
+
+def argmax_abs(x):
+    """Index of the entry of ``x`` with the largest magnitude.
+
+    Parameters
+    ----------
+    x : (m,) array
+
+    Returns
+    -------
+    i : int
+        Index of the entry with the largest absolute value.
+    """
+    return int(np.argmax(np.abs(x)))
+
+
+def csr_row_dot(data, indices, indptr, ik, x):
+    """Compute ``A[ik] @ x`` for a CSR matrix, without slicing the row.
+
+    Parameters
+    ----------
+    data : (nnz,) array
+        CSR data array.
+    indices : (nnz,) array
+        CSR column index array.
+    indptr : (m + 1,) array
+        CSR row pointer array.
+    ik : int
+        Row index to use.
+    x : (n,) array
+        Vector to multiply.
+
+    Returns
+    -------
+    dot : float
+        The inner product of row ``ik`` with ``x``.
+    """
+    cols = indices[indptr[ik] : indptr[ik + 1]]
+    vals = data[indptr[ik] : indptr[ik + 1]]
+    return vals @ x[cols]
+
+
+def csr_matvec(data, indices, indptr, x, out):
+    """Compute ``A @ x`` into ``out`` for a CSR matrix.
+
+    Parameters
+    ----------
+    data : (nnz,) array
+        CSR data array.
+    indices : (nnz,) array
+        CSR column index array.
+    indptr : (m + 1,) array
+        CSR row pointer array.
+    x : (n,) array
+        Vector to multiply.
+    out : (m,) array
+        Output buffer for the product.
+    """
+    n_rows = indptr.shape[0] - 1
+    A = csr_matrix((data, indices, indptr), shape=(n_rows, x.shape[0]))
+    np.copyto(out, A @ x)
+
+
+def greedy_probs(residual, row_norms_sq, fro_sq, theta, prob):
+    """Write the relaxed-greedy sampling probabilities into ``prob``.
+
+    Parameters
+    ----------
+    residual : (m,) array
+        The current residual ``b - A @ xk``.
+    row_norms_sq : (m,) array
+        Squared norms of the original (unnormalized) rows of ``A``.
+    fro_sq : float
+        Squared Frobenius norm of the original ``A``.
+    theta : float
+        Relaxation parameter in the range [0, 1].
+    prob : (m,) array
+        Output buffer for the sampling probabilities.
+
+    Returns
+    -------
+    total : float
+        Total unnormalized probability mass. Zero if no row passed
+        the threshold.
+    """
+    residual_sq = residual ** 2
+    np.multiply(row_norms_sq, residual_sq, out=prob)
+    res_norm_sq = prob.sum()
+    epsilon = theta / res_norm_sq * residual_sq + (1.0 - theta) / fro_sq
+    prob[prob < epsilon * res_norm_sq * row_norms_sq] = 0.0
+    total = prob.sum()
+    if total > 0.0:
+        prob /= total
+    return total
+
+
+def block_averaged_step(A, b, xk, idxs):
+    """Add the average of the row projections of ``idxs`` to ``xk``.
+
+    The rows of ``A`` are assumed to have unit norm.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate. Updated in place.
+    idxs : (K,) array
+        Row indices of the block, possibly with repeats.
+    """
+    A_block = A[idxs]
+    coef = (b[idxs] - A_block @ xk) / idxs.shape[0]
+    xk += A_block.T @ coef
+
+
+def lookahead_cost(residual, residual_sq, gramian, gramian2, out):
+    """Fill the two-step lookahead cost matrix into ``out``.
+
+    Computes ``out[i, j] = r2[i] + r2[j] - 2 r[i] r[j] G[i, j]
+    + r2[i] G2[i, j]`` with broadcast arithmetic and one temporary.
+
+    Parameters
+    ----------
+    residual : (m,) array
+        The current residual ``b - A @ xk``.
+    residual_sq : (m,) array
+        Elementwise square of ``residual``.
+    gramian : (m, m) array
+        The Gramian ``A @ A.T`` of the normalized matrix.
+    gramian2 : (m, m) array
+        Elementwise square of ``gramian``.
+    out : (m, m) array
+        Output buffer for the cost matrix.
+    """
+    np.add(residual_sq[:, None], residual_sq[None, :], out=out)
+    tmp = np.outer(residual, residual)
+    np.multiply(tmp, gramian, out=tmp)
+    out -= tmp
+    out -= tmp
+    np.multiply(gramian2, residual_sq[:, None], out=tmp)
+    out += tmp
+
+
+def abs_residuals(A, b, xk, out):
+    """Compute ``abs(b - A @ xk)`` into ``out``.
+
+    Parameters
+    ----------
+    A : (m, n) array
+        The normalized matrix of the linear system.
+    b : (m,) array
+        The normalized right hand side of the linear system.
+    xk : (n,) array
+        The current iterate.
+    out : (m,) array
+        Output buffer for the absolute residuals.
+    """
+    np.matmul(A, xk, out=out)
+    np.subtract(b, out, out=out)
+    np.abs(out, out=out)
@@ -1,6 +1,5 @@
 import numpy as np
 import scipy.sparse as sp
-import scipy.sparse.linalg as spla
 
 
 def compute_row_norms(A):
@@ -15,9 +14,11 @@ def compute_row_norms(A):
     row_norms : (m,) array
     """
     if sp.issparse(A):
-        return spla.norm(A, axis=1)
+        return np.sqrt(np.asarray(A.multiply(A).sum(axis=1)).ravel())
 
-    return np.linalg.norm(A, axis=1)
+    # A single fused pass over ``A``,
+    # unlike ``np.linalg.norm`` which materializes an m-by-n array of squares.
+    return np.sqrt(np.einsum("ij,ij->i", A, A))
 
 
 def normalize_matrix(A, row_norms):
@@ -36,17 +37,22 @@ def normalize_matrix(A, row_norms):
     # Be careful! Do not try ``A / row_norms[:, None]`` with a sparse matrix!
     # You will end up with a np.matrix rather than a sparse matrix.
 
-    normalization_matrix = sp.diags(1 / row_norms)
-    return normalization_matrix @ A
+    if sp.issparse(A):
+        # Scales the nonzeros directly instead of building an m-by-m
+        # diagonal matrix and dispatching a sparse-sparse matmul.
+        return type(A)(A.multiply(1 / row_norms[:, None]))
+    return A * (1 / row_norms)[:, None]
 
 
-def normalize_system(A, b):
+def normalize_system(A, b, dtype=np.float64):
     """Scale the system ``A @ x = b`` so that the rows of ``A`` have norm 1.
 
     Parameters
     ----------
     A : (m, n) spmatrix or array_like
     b : (m,) or (m, 1) array_like
+    dtype : numpy dtype, optional
+        Storage type of the normalized system.
 
     Returns
     -------
@@ -54,12 +60,21 @@ def normalize_system(A, b):
         Copy of ``A`` with rows scaled to have norm ``1``.
     b_normalized : (m,) or (m, 1) array
         Copy of ``b`` with entries divided by the row norms of ``A``.
+
+    Notes
+    -----
+    Dense matrices are copied once into C-contiguous storage
+    so that each row is a stride-1 vector in the iteration hot loop.
     """
-    if not sp.issparse(A):
-        A = np.array(A)
+    if sp.issparse(A):
+        A = A.astype(dtype)
+    else:
+        A = np.ascontiguousarray(A, dtype=dtype)
 
     row_norms = compute_row_norms(A)
     A = normalize_matrix(A, row_norms=row_norms)
-    b = np.array(b).ravel() / row_norms
+    if not sp.issparse(A):
+        A = np.ascontiguousarray(A)
+    b = np.asarray(b, dtype=dtype).ravel() / row_norms
 
     return A, b, row_norms
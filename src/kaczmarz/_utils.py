@@ -1,16 +1,21 @@
+import numpy as np
 from scipy import sparse
 
 
 def scale_rows(A, v):
     """Scale each row of A by the corresponding entry of v and return the
     result."""
-    return sparse.spdiags(v, 0, len(v), len(v)) @ A
+    if sparse.issparse(A):
+        return A.multiply(np.reshape(v, (-1, 1))).tocsr()
+    return A * np.reshape(v, (-1, 1))
 
 
 def scale_cols(A, v):
     """Scale each column of A by the corresponding entry of v and return the
     result."""
-    return A @ sparse.spdiags(v, 0, len(v), len(v))
+    if sparse.issparse(A):
+        return A.multiply(np.reshape(v, (1, -1))).tocsr()
+    return A * np.reshape(v, (1, -1))
 
 
 def square(A):
@@ -1,13 +1,24 @@
 """A module providing selection strategies for the Kaczmarz algorithm."""
 
-from collections import deque
+
+import itertools
 
 import numpy as np
 from scipy import sparse
 
 import kaczmarz
 
-from ._utils import scale_cols, scale_rows, square
+from ._kernels import (
+    abs_residuals,
+    argmax_abs,
+    block_averaged_step,
+    csr_matvec,
+    cyclic_loop,
+    greedy_probs,
+    lookahead_cost,
+    maxdistance_loop,
+)
+from ._utils import square
 
 
 class Cyclic(kaczmarz.Base):
@@ -25,24 +36,94 @@ class Cyclic(kaczmarz.Base):
 
     def __init__(self, *base_args, order=None, **base_kwargs):
         super().__init__(*base_args, **base_kwargs)
-        self._row_index = -1
         if order is None:
             order = range(self._n_rows)
         self._order = order
+        # ``itertools.cycle`` advances with a C-level pointer bump,
+        # avoiding an index update and modulo per iteration.
+        self._order_cycle = itertools.cycle(order)
 
     def _select_row_index(self, xk):
-        self._row_index = (1 + self._row_index) % self._n_rows
-        return self._order[self._row_index]
+        return next(self._order_cycle)
+
+    @classmethod
+    def solve(cls, *base_args, **base_kwargs):
+        """Solve a linear system of equations using cyclic Kaczmarz.
+
+        Runs the whole iteration in a compiled kernel when possible.
+        See :meth:`kaczmarz.Base.solve` for the parameters.
+        """
+        iterates = cls.iterates(*base_args, **base_kwargs)
+        x = iterates._solve_compiled()
+        if x is not None:
+            return x
+        if not iterates._has_user_callback:
+            iterates._copy_iterates = False
+        for x in iterates:
+            pass
+        return x
+
+    def _solve_compiled(self):
+        """Run the entire solve inside the compiled cyclic kernel.
+
+        Returns
+        -------
+        x : (n,) or (n, 1) array or None
+            The solution, or None when the configuration requires the
+            per-iteration Python path (no numba, sparse matrix, a user
+            callback, or subclass overrides of the iteration hooks).
+        """
+        if cyclic_loop is None or sparse.issparse(self._A):
+            return None
+        if self._has_user_callback:
+            return None
+        if type(self)._select_row_index is not Cyclic._select_row_index:
+            return None
+        if type(self)._update_iterate is not kaczmarz.Base._update_iterate:
+            return None
+        if type(self)._stopping_criterion is not kaczmarz.Base._stopping_criterion:
+            return None
+
+        order = np.ascontiguousarray(self._order, dtype=np.int64)
+        tol = -1.0 if self._tol is None else self._tol
+        self._xk = self._x0.copy()
+        self._k = cyclic_loop(
+            self._A,
+            self._b,
+            self._xk,
+            order,
+            tol,
+            float(self._maxiter),
+            self._check_every,
+        )
+        return self.xk
 
 
 class MaxDistanceLookahead(kaczmarz.Base):
     """Choose equations which lead to the most progress after a 2 step lookahead."""
 
+    _track_residual = True
+
     def __init__(self, *base_args, **base_kwargs):
         super().__init__(*base_args, **base_kwargs)
         self._next_i = None
-        self._gramian = self._A @ self._A.T
-        self._gramian2 = square(self._gramian)
+        gramian = self._gramian
+        if gramian is None:
+            # The system was too large for the base class's Gramian budget.
+            gramian = self._A @ self._A.T
+            if sparse.issparse(gramian):
+                gramian = gramian.toarray()
+        # The argmax over the cost matrix only needs a few correct leading
+        # digits, so the m**2 arrays are stored in float32, halving the
+        # memory traffic of the selection pass. The projection itself and
+        # the tracked residual stay in the storage dtype.
+        self._gramian32 = np.asarray(gramian, dtype=np.float32)
+        self._gramian2 = square(self._gramian32)
+        # Scratch space for the m-by-m cost matrix,
+        # reused across iterations to avoid four m**2 temporaries per step.
+        self._cost_buf = np.empty((self._n_rows, self._n_rows), dtype=np.float32)
+        self._residual32 = np.empty(self._n_rows, dtype=np.float32)
+        self._residual32_sq = np.empty(self._n_rows, dtype=np.float32)
 
     def _select_row_index(self, xk):
         if self._next_i is not None:
@@ -50,19 +131,22 @@ class MaxDistanceLookahead(kaczmarz.Base):
             self._next_i = None
             return temp
 
-        residual = self._b - self._A @ xk
-        residual_2 = np.square(residual)
-        cost_mat = np.array(
-            residual_2[:, None]
-            + residual_2[None, :]
-            - 2 * scale_rows(scale_cols(self._gramian, residual), residual)
-            + scale_rows(self._gramian2, residual_2)
-        )
-        best_cost = np.max(cost_mat)
-
-        sort_idxs = np.argsort(residual_2)[::-1]
-        best_i = sort_idxs[np.any(cost_mat[sort_idxs, :] == best_cost, axis=1)][0]
-        self._next_i = np.argwhere(cost_mat[best_i] == best_cost)[0][0]
+        if self._rk is not None:
+            np.copyto(self._residual32, self._rk)
+        else:
+            np.copyto(self._residual32, self._residual(xk))
+        residual = self._residual32
+        residual_2 = np.square(residual, out=self._residual32_sq)
+
+        cost_mat = self._cost_buf
+        lookahead_cost(residual, residual_2, self._gramian32, self._gramian2, cost_mat)
+
+        # Among rows achieving the best cost, prefer the largest residual,
+        # as the full residual-sorted scan used to.
+        row_max = cost_mat.max(axis=1)
+        best_cost = row_max.max()
+        best_i = int(np.argmax(np.where(row_max == best_cost, residual_2, -np.inf)))
+        self._next_i = int(np.argmax(cost_mat[best_i]))
         return best_i
 
 
@@ -78,10 +162,252 @@ class MaxDistance(kaczmarz.Base):
        *Canadian Journal of Mathematics*, 6:393–404, 1954.
     """
 
+    _track_residual = True
+
+    def __init__(self, *base_args, **base_kwargs):
+        super().__init__(*base_args, **base_kwargs)
+        self._abs_residual = np.empty(self._n_rows)
+
+    def _select_row_index(self, xk):
+        if self._rk is not None:
+            return argmax_abs(self._rk)
+        if sparse.issparse(self._A):
+            csr_matvec(
+                self._A.data,
+                self._A.indices,
+                self._A.indptr,
+                xk,
+                self._abs_residual,
+            )
+            np.subtract(self._b, self._abs_residual, out=self._abs_residual)
+            np.abs(self._abs_residual, out=self._abs_residual)
+        else:
+            abs_residuals(self._A, self._b, xk, self._abs_residual)
+        return np.argmax(self._abs_residual)
+
+    @classmethod
+    def solve(cls, *base_args, **base_kwargs):
+        """Solve a linear system of equations using max-distance Kaczmarz.
+
+        Runs the whole iteration in a compiled kernel when possible.
+        See :meth:`kaczmarz.Base.solve` for the parameters.
+        """
+        iterates = cls.iterates(*base_args, **base_kwargs)
+        x = iterates._solve_compiled()
+        if x is not None:
+            return x
+        if not iterates._has_user_callback:
+            iterates._copy_iterates = False
+        for x in iterates:
+            pass
+        return x
+
+    def _solve_compiled(self):
+        """Run the entire solve inside the compiled max-distance kernel.
+
+        Returns
+        -------
+        x : (n,) or (n, 1) array or None
+            The solution, or None when the configuration requires the
+            per-iteration Python path (no numba, sparse matrix, no cached
+            Gramian, a user callback, or subclass overrides of the
+            iteration hooks).
+        """
+        if maxdistance_loop is None or sparse.issparse(self._A):
+            return None
+        if self._rk is None or self._has_user_callback:
+            return None
+        if type(self)._select_row_index is not MaxDistance._select_row_index:
+            return None
+        if type(self)._update_iterate is not kaczmarz.Base._update_iterate:
+            return None
+        if type(self)._stopping_criterion is not kaczmarz.Base._stopping_criterion:
+            return None
+
+        tol = -1.0 if self._tol is None else self._tol
+        self._xk = self._x0.copy()
+        self._k = maxdistance_loop(
+            self._A,
+            self._b,
+            self._xk,
+            self._rk,
+            self._gramian,
+            tol,
+            float(self._maxiter),
+            self._check_every,
+        )
+        return self.xk
+
+
+class Block(kaczmarz.Base):
+    """Project onto a randomly chosen block of rows at each iteration.
+
+    Gathering ``block_size`` rows per step amortizes the per-iteration
+    overhead over a single small least-squares solve, turning many
+    vector-vector operations into one matrix-vector operation.
+
+    Parameters
+    ----------
+    block_size : int, optional
+        Number of consecutive rows used for each block projection.
+
+    References
+    ----------
+    1. D. Needell and J. A. Tropp.
+       "Paved with good intentions:
+       Analysis of a randomized block Kaczmarz method."
+       *Linear Algebra and its Applications*, 441, 199-221, 2014.
+    """
+
+    def __init__(self, *base_args, block_size=None, **base_kwargs):
+        super().__init__(*base_args, **base_kwargs)
+        if block_size is None:
+            block_size = 32
+        self._block_size = min(block_size, self._n_rows)
+
+    def _select_row_index(self, xk):
+        start = self._rng.integers(self._n_rows - self._block_size + 1)
+        return list(range(start, start + self._block_size))
+
+    def _update_iterate(self, xk, tauk):
+        """Project onto the intersection of the hyperplanes of rows ``tauk``."""
+        A_block = self._A[tauk]
+        if sparse.issparse(A_block):
+            A_block = A_block.toarray()
+        residual = self._b[tauk] - A_block @ xk
+        gram = A_block @ A_block.T
+        # lstsq rather than solve since blocks may contain duplicate rows.
+        coef, *_ = np.linalg.lstsq(gram, residual, rcond=None)
+        xk += A_block.T @ coef
+        return xk
+
+
+class BlockCyclic(kaczmarz.Base):
+    """Cycle through fixed blocks of rows, projecting onto a block at a time.
+
+    The pseudoinverse of each block is precomputed once, so each iteration
+    costs two small matrix-vector products instead of ``block_size``
+    separate row projections.
+
+    Parameters
+    ----------
+    block_size : int, optional
+        Number of consecutive rows per block.
+
+    References
+    ----------
+    1. D. Needell and J. A. Tropp.
+       "Paved with good intentions:
+       Analysis of a randomized block Kaczmarz method."
+       *Linear Algebra and its Applications*, 441, 199-221, 2014.
+    """
+
+    def __init__(self, *base_args, block_size=None, **base_kwargs):
+        super().__init__(*base_args, **base_kwargs)
+        if block_size is None:
+            block_size = 32
+        block_size = min(block_size, self._n_rows)
+        self._blocks = [
+            list(range(start, min(start + block_size, self._n_rows)))
+            for start in range(0, self._n_rows, block_size)
+        ]
+        self._block_pinvs = []
+        for block in self._blocks:
+            A_block = self._A[block]
+            if sparse.issparse(A_block):
+                A_block = A_block.toarray()
+            self._block_pinvs.append(np.linalg.pinv(A_block))
+        self._block_index = -1
+
     def _select_row_index(self, xk):
-        # TODO: use auxiliary update for the residual.
-        residual = self._b - self._A @ xk
-        return np.argmax(np.abs(residual))
+        self._block_index = (1 + self._block_index) % len(self._blocks)
+        return self._blocks[self._block_index]
+
+    def _update_iterate(self, xk, tauk):
+        """Project onto the solution set of the equations in block ``tauk``."""
+        A_block = self._A[tauk]
+        residual = self._b[tauk] - A_block @ xk
+        xk += self._block_pinvs[self._block_index] @ residual
+        return xk
+
+
+class BlockAveraged(kaczmarz.Base):
+    """Average the row projections of a randomly sampled block.
+
+    Unlike :class:`Block`, which projects onto the intersection of the
+    block's hyperplanes, this variant averages the ``block_size``
+    independent row projections. The projections commute with the
+    average, so the whole step is two matrix-vector products on the
+    gathered block instead of ``block_size`` separate rank-1 updates.
+
+    Parameters
+    ----------
+    block_size : int, optional
+        Number of rows sampled (with replacement) per iteration.
+
+    References
+    ----------
+    1. J. D. Moorman, T. K. Tu, D. Molitor, and D. Needell.
+       "Randomized Kaczmarz with averaging."
+       *BIT Numerical Mathematics*, 61, 337-359, 2021.
+    """
+
+    def __init__(self, *base_args, block_size=None, **base_kwargs):
+        super().__init__(*base_args, **base_kwargs)
+        if block_size is None:
+            block_size = 32
+        self._block_size = min(block_size, self._n_rows)
+
+    def _select_row_index(self, xk):
+        return self._rng.integers(self._n_rows, size=self._block_size).tolist()
+
+    def _update_iterate(self, xk, tauk):
+        """Add the average of the row projections of ``tauk``."""
+        if sparse.issparse(self._A):
+            A_block = self._A[tauk]
+            residual = self._b[tauk] - A_block @ xk
+            xk += A_block.T @ (residual / len(tauk))
+            return xk
+        block_averaged_step(self._A, self._b, xk, np.asarray(tauk, dtype=np.int64))
+        return xk
+
+
+def _alias_table(p):
+    """Build a Vose alias table for sampling from a discrete distribution.
+
+    Parameters
+    ----------
+    p : (m,) array_like
+        Relative probability of each outcome. Need not be normalized.
+
+    Returns
+    -------
+    prob : (m,) array
+        Acceptance probability of each outcome.
+    alias : (m,) array
+        Outcome to fall back on when the acceptance test fails.
+    """
+    p = np.asarray(p, dtype=np.float64)
+    m = len(p)
+    prob = p * (m / p.sum())
+    alias = np.arange(m)
+
+    small = [i for i in range(m) if prob[i] < 1.0]
+    large = [i for i in range(m) if prob[i] >= 1.0]
+    while small and large:
+        s = small.pop()
+        big = large.pop()
+        alias[s] = big
+        prob[big] -= 1.0 - prob[s]
+        if prob[big] < 1.0:
+            small.append(big)
+        else:
+            large.append(big)
+    # Entries left over due to rounding have acceptance probability 1.
+    for i in small + large:
+        prob[i] = 1.0
+
+    return prob, alias
 
 
 class Random(kaczmarz.Base):
@@ -93,12 +419,45 @@ class Random(kaczmarz.Base):
         Sampling probability for each equation. Uniform by default.
     """
 
+    # Number of row indices drawn per batch.
+    # Batching amortizes the per-call overhead of the generator.
+    _batch_size = 4096
+
     def __init__(self, *base_args, p=None, **base_kwargs):
         super().__init__(*base_args, **base_kwargs)
+        self._set_row_probabilities(p)
+
+    def _set_row_probabilities(self, p):
+        """Set the sampling distribution and precompute its alias table.
+
+        With the alias table in hand, each draw is O(1), whereas a binary
+        search on the cumulative sum is O(log m) and ``np.random.choice``
+        additionally rebuilds the cumulative sum on every call.
+        """
         self._p = p  # p=None corresponds to uniform.
+        if p is None:
+            self._alias_prob = None
+            self._alias = None
+        else:
+            self._alias_prob, self._alias = _alias_table(p)
+        self._idx_buffer = None
+        self._idx_pos = 0
+
+    def _refill_index_buffer(self):
+        """Draw the next batch of row indices in one vectorized call."""
+        idxs = self._rng.integers(self._n_rows, size=self._batch_size)
+        if self._alias is not None:
+            rejected = self._rng.random(self._batch_size) >= self._alias_prob[idxs]
+            idxs[rejected] = self._alias[idxs[rejected]]
+        self._idx_buffer = idxs
+        self._idx_pos = 0
 
     def _select_row_index(self, xk):
-        return np.random.choice(self._n_rows, p=self._p)
+        if self._idx_buffer is None or self._idx_pos == self._batch_size:
+            self._refill_index_buffer()
+        ik = self._idx_buffer[self._idx_pos]
+        self._idx_pos += 1
+        return int(ik)
 
 
 class SVRandom(Random):
@@ -113,8 +472,7 @@ class SVRandom(Random):
 
     def __init__(self, *base_args, **base_kwargs):
         super().__init__(*base_args, **base_kwargs)
-        squared_row_norms = self._row_norms ** 2
-        self._p = squared_row_norms / squared_row_norms.sum()
+        self._set_row_probabilities(self._row_norms_sq / self._row_norms_sq.sum())
 
 
 class UniformRandom(Random):
@@ -141,20 +499,40 @@ class Quantile(Random):
     1. There will be a reference soon. Keep an eye out for that.
     """
 
+    _track_residual = True
+
     def __init__(self, *args, quantile=1.0, **kwargs):
         super().__init__(*args, **kwargs)
         self._quantile = quantile
 
     def _distance(self, xk, ik):
-        return np.abs(self._b[ik] - self._A[ik] @ xk)
+        if self._rk is not None:
+            return np.abs(self._rk[ik])
+        return np.abs(self._b[ik] - self._row_dot(ik, xk))
 
     def _threshold_distances(self, xk):
-        return np.abs(self._b - self._A @ xk)
+        if self._rk is not None:
+            return np.abs(self._rk)
+        residual = self._residual(xk)
+        return np.abs(residual, out=residual)
 
     def _threshold(self, xk):
         distances = self._threshold_distances(xk)
 
-        return np.quantile(distances, self._quantile)
+        # Single order statistic via introselect rather than the full sort
+        # performed by ``np.quantile``. The two partitioned entries are
+        # blended to reproduce ``np.quantile``'s linear interpolation.
+        position = self._quantile * (len(distances) - 1)
+        k = int(position)
+        fraction = position - k
+        if fraction == 0.0:
+            return np.partition(distances, k)[k]
+        partitioned = np.partition(distances, (k, k + 1))
+        return partitioned[k] + fraction * (partitioned[k + 1] - partitioned[k])
+
+    # Acceptance slack, matching what ``np.isclose`` used to allow.
+    _rtol = 1e-5
+    _atol = 1e-8
 
     def _select_row_index(self, xk):
         ik = super()._select_row_index(xk)
@@ -162,7 +540,9 @@ class Quantile(Random):
         distance = self._distance(xk, ik)
         threshold = self._threshold(xk)
 
-        if distance < threshold or np.isclose(distance, threshold):
+        # A single scalar comparison. ``np.isclose`` dispatches through
+        # ufunc machinery and allocates temporaries on every call.
+        if distance <= threshold + self._atol + self._rtol * threshold:
             return ik
 
         return -1  # No projection please
@@ -188,8 +568,16 @@ class SampledQuantile(Quantile):
         self._n_samples = n_samples
 
     def _threshold_distances(self, xk):
-        idxs = np.random.choice(self._n_rows, self._n_samples, replace=False)
-        return np.abs(self._b[idxs] - self._A[idxs] @ xk)
+        # Sampling with replacement is O(n_samples),
+        # while ``choice(..., replace=False)`` permutes all m rows,
+        # and the two are equally good quantile estimates.
+        idxs = self._rng.integers(self._n_rows, size=self._n_samples)
+        if self._rk is not None:
+            return np.abs(self._rk[idxs])
+        # One full matvec then a gather: ``self._A[idxs]`` would copy
+        # n_samples whole rows of A just to dot each with xk once.
+        residual = self._residual(xk)
+        return np.abs(residual[idxs])
 
 
 class WindowedQuantile(Quantile):
@@ -213,15 +601,26 @@ class WindowedQuantile(Quantile):
         super().__init__(*args, **kwargs)
         if window_size is None:
             window_size = self._n_rows
-        self._window = deque([], maxlen=window_size)
+        # Ring buffer rather than a deque:
+        # ``np.quantile`` would otherwise copy the deque into an array
+        # on every call to ``_threshold_distances``.
+        self._window = np.empty(window_size)
+        self._window_pos = 0
+        self._window_full = False
 
     def _distance(self, xk, ik):
         distance = super()._distance(xk, ik)
-        self._window.append(distance)
+        self._window[self._window_pos] = distance
+        self._window_pos += 1
+        if self._window_pos == len(self._window):
+            self._window_pos = 0
+            self._window_full = True
         return distance
 
     def _threshold_distances(self, xk):
-        return self._window
+        if self._window_full:
+            return self._window
+        return self._window[: self._window_pos]
 
 
 class RandomOrthoGraph(kaczmarz.Base):
@@ -247,27 +646,49 @@ class RandomOrthoGraph(kaczmarz.Base):
 
     def __init__(self, *args, p=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self._gramian = self._A @ self._A.T
 
-        # Map each row index i to indexes of rows that are NOT orthogonal to it.
-        self._i_to_neighbors = {}
-        for i in range(self._n_rows):
-            self._i_to_neighbors[i] = self._gramian[[i], :].nonzero()[1]
+        # The orthogonality graph, stored CSR-style: the neighbors of row i
+        # (rows that are NOT orthogonal to it) are the slice
+        # ``_neighbor_indices[_neighbor_indptr[i]:_neighbor_indptr[i + 1]]``.
+        # Only the sparsity pattern of the Gramian is needed,
+        # so the Gramian itself is not kept around.
+        gramian = self._A @ self._A.T
+        if sparse.issparse(gramian):
+            gramian = gramian.tocsr()
+            gramian.eliminate_zeros()
+            self._neighbor_indptr = gramian.indptr
+            self._neighbor_indices = gramian.indices
+        else:
+            rows, cols = np.nonzero(gramian)
+            counts = np.bincount(rows, minlength=self._n_rows)
+            self._neighbor_indptr = np.concatenate(([0], np.cumsum(counts)))
+            self._neighbor_indices = cols
         if p is None:
             p = np.ones((self._n_rows,))
         self._p = p
+        # Scratch space for the masked cumulative weights used when sampling.
+        self._weight_buf = np.empty(self._n_rows)
 
         self._selectable = self._A @ self._x0 - self._b != 0
 
+    def _neighbors(self, ik):
+        """Indices of the rows that are not orthogonal to row ``ik``."""
+        start = self._neighbor_indptr[ik]
+        end = self._neighbor_indptr[ik + 1]
+        return self._neighbor_indices[start:end]
+
     def _update_selectable(self, ik):
-        self._selectable[self._i_to_neighbors[ik]] = True
+        self._selectable[self._neighbors(ik)] = True
         self._selectable[ik] = False
 
     def _select_row_index(self, xk):
-        p = self._p.copy()
-        p[~self._selectable] = 0
-        p /= p.sum()
-        ik = np.random.choice(self._n_rows, p=p)
+        # Sample by inverting the cumulative masked weights directly.
+        # ``rng.choice(p=...)`` would copy, renormalize and validate the
+        # probabilities on every call just to do the same search.
+        np.multiply(self._p, self._selectable, out=self._weight_buf)
+        np.cumsum(self._weight_buf, out=self._weight_buf)
+        draw = self._rng.random() * self._weight_buf[-1]
+        ik = int(np.searchsorted(self._weight_buf, draw, side="right"))
         self._update_selectable(ik)
         return ik
 
@@ -310,33 +731,28 @@ class RelaxedGreedy(kaczmarz.Base):
     Applied Mathematics Letters, Volume 83, 2018, Pages 21-26,
     """
 
+    _track_residual = True
+
     def __init__(self, *args, theta=0.5, **kwargs):
         super().__init__(*args, **kwargs)
         if theta < 0 or theta > 1:
             raise Exception("Theta value outside parameter range [0, 1]")
         self._theta = theta
-        self._row_norms_sq = self._row_norms ** 2
         self._fro_sq = np.sum(self._row_norms_sq)
+        self._prob_buf = np.empty(self._n_rows)
 
     # Bai and Wu's algorithm
     def _select_row_index(self, xk):
-        residual_sq = (self._b - self._A @ xk) ** 2
-        residual_unnormalized_sq = self._row_norms_sq * residual_sq
-        res_norm_sq = residual_unnormalized_sq.sum()
-        epsilon = (
-            self._theta / res_norm_sq * residual_sq + (1 - self._theta) / self._fro_sq
+        if self._rk is not None:
+            residual = self._rk
+        else:
+            residual = self._b - self._A @ xk
+        total = greedy_probs(
+            residual, self._row_norms_sq, self._fro_sq, self._theta, self._prob_buf
         )
-
-        index_bool = residual_unnormalized_sq >= epsilon * res_norm_sq * (
-            self._row_norms_sq
-        )
-        if ~np.any(index_bool):
+        if total == 0.0:
             raise Exception("Index set empty")
-
-        prob = residual_unnormalized_sq
-        prob[~index_bool] = 0
-        prob /= prob.sum()
-        return np.random.choice(self._n_rows, p=prob)
+        return self._rng.choice(self._n_rows, p=self._prob_buf)
 
 
 class ParallelOrthoUpdate(RandomOrthoGraph):
@@ -354,29 +770,42 @@ class ParallelOrthoUpdate(RandomOrthoGraph):
         if q is None:
             q = self._n_rows
         self._q = q
+        # Working copy of the sampling weights for the group being built.
+        self._group_weights = np.empty(self._n_rows)
 
     def _update_iterate(self, xk, tauk):
-        """Do a sum of the usual updates."""
-        # TODO: We should implement averaged kaczmarz as a mixin or something.
-        xkp1 = xk
-        for i in tauk:
-            xkp1 = super()._update_iterate(xkp1, i)
-        return xkp1
+        """Do a sum of the usual updates.
+
+        The selected rows are mutually orthogonal, so their projections
+        commute and the sum of updates equals the sequential result.
+        Gathering the rows turns the whole group into two matrix-vector
+        products instead of one Python-level projection per row.
+        """
+        A_sel = self._A[tauk]
+        alpha = self._b[tauk] - A_sel @ xk
+        xk += A_sel.T @ alpha
+        return xk
 
     def _select_row_index(self, xk):
         """Select a group of mutually orthogonal rows to project onto."""
-        curr_selectable = self._selectable.copy()  # Equations that are not satisfied.
+        # Start from the weights of the unsatisfied equations and knock out
+        # each chosen row's neighbors, touching only O(deg) entries per
+        # draw instead of re-masking and renormalizing the whole vector.
+        weights = self._group_weights
+        np.multiply(self._p, self._selectable, out=weights)
         tauk = []
-        curr_p = self._p.copy()
-        while len(tauk) != self._q and np.any(curr_selectable):
-            curr_p[~curr_selectable] = 0  # Don't want to sample unselectable entries
-            curr_p /= curr_p.sum()  # Renormalize probabilities
-
-            i = np.random.choice(self._n_rows, p=curr_p)
+        while len(tauk) != self._q:
+            np.cumsum(weights, out=self._weight_buf)
+            total = self._weight_buf[-1]
+            if total <= 0.0:  # Nothing selectable remains.
+                break
+            draw = self._rng.random() * total
+            i = int(np.searchsorted(self._weight_buf, draw, side="right"))
             tauk.append(i)
 
-            # Remove rows from selectable set that are not orthogonal to i
-            curr_selectable[self._i_to_neighbors[i]] = False
+            # Remove rows from selectable set that are not orthogonal to i.
+            # Row i is its own neighbor, so its weight is removed as well.
+            weights[self._neighbors(i)] = 0.0
 
         for i in tauk:
             self._update_selectable(i)
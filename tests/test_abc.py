@@ -127,6 +127,14 @@ def test_solve(eye23, ones2, zeros3, DummyStrategy):
     assert [1, 0, 0] == list(x)
 
 
+def test_solve_batch(eye33, DummyStrategy, allclose):
+    """Each column of B should be solved independently."""
+    B = np.array([[1, 2], [0, 0], [0, 0]])
+    X = kaczmarz.Cyclic.solve_batch(eye33, B)
+    assert (3, 2) == X.shape
+    assert allclose(X, B)
+
+
 def test_tolerance(eye23, ones2, DummyStrategy):
     x_exact = np.array([1, 1, 0])
 
@@ -140,6 +148,19 @@ def test_tolerance(eye23, ones2, DummyStrategy):
     terminates_after_n_iterations(iterates, 0)
 
 
+def test_check_every(eye23, ones2, DummyStrategy):
+    """Passing ``check_every=n`` should only check ``tol`` every n iterations."""
+    # One projection onto the first row solves the system exactly.
+    x0 = np.array([0, 1, 0])
+
+    iterates = DummyStrategy.iterates(eye23, ones2, x0)
+    terminates_after_n_iterations(iterates, 1)
+
+    # The residual is not inspected at iteration 1, so we stop at iteration 2.
+    iterates = DummyStrategy.iterates(eye23, ones2, x0, check_every=2)
+    terminates_after_n_iterations(iterates, 2)
+
+
 def test_callback(eye23, ones2, zeros3, DummyStrategy):
     """Callback function should be called after each iteration."""
     actual_iterates = []
@@ -170,6 +191,28 @@ def test_array_like(eye23, ones2, zeros3, DummyStrategy):
     assert [1, 0, 0] == list(next(iterator))
 
 
+def test_no_copy_iterates(speye23, ones2, zeros3, DummyStrategy):
+    """With ``copy_iterates=False``, iterates alias the internal buffer."""
+    iterator = iter(DummyStrategy.iterates(speye23, ones2, zeros3, copy_iterates=False))
+    x_first = next(iterator)
+    x_second = next(iterator)
+    assert np.shares_memory(x_first, x_second)
+    assert [1, 0, 0] == list(x_first)
+
+
+def test_float32_storage(eye23, ones2, DummyStrategy, allclose):
+    """``dtype=np.float32`` should store and iterate in single precision."""
+    solver = DummyStrategy.iterates(eye23, ones2, tol=1e-3, dtype=np.float32)
+    assert np.float32 == solver._A.dtype
+    x = DummyStrategy.solve(eye23, ones2, tol=1e-3, dtype=np.float32)
+    assert np.float32 == x.dtype
+    assert allclose([1, 0, 0], x, atol=1e-3)
+
+    # Tolerances beyond single precision should warn.
+    with pytest.warns(UserWarning):
+        DummyStrategy.iterates(eye23, ones2, tol=1e-6, dtype=np.float32)
+
+
 def test_iterates_are_copies(speye23, ones2, zeros3, DummyStrategy):
     """Check that modifying the iterate inplace does not affect the underlying iteration."""
     iterator = iter(DummyStrategy.iterates(speye23, ones2, zeros3))
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import kaczmarz
+
+
+def test_block_covers_whole_system(eye33, ones3):
+    """A block covering every row solves the system in a single projection."""
+    x0 = np.zeros(3)
+    iterates = kaczmarz.Block.iterates(eye33, ones3, x0, block_size=3)
+    iterator = iter(iterates)
+    assert [0, 0, 0] == list(next(iterator))
+    assert [1, 1, 1] == list(next(iterator))
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+
+def test_block_size_is_clipped(eye23, ones2):
+    """Blocks larger than the number of rows should use all rows."""
+    solver = kaczmarz.Block(eye23, ones2, block_size=100)
+    assert 2 == solver._block_size
+    assert [0, 1] == solver._select_row_index(np.zeros(3))
+
+
+def test_block_cyclic_visits_blocks_in_order(eye33, ones3):
+    """Blocks should be selected cyclically, covering every row."""
+    solver = kaczmarz.BlockCyclic(eye33, ones3, block_size=2)
+    x = np.zeros(3)
+    assert [0, 1] == solver._select_row_index(x)
+    assert [2] == solver._select_row_index(x)
+    assert [0, 1] == solver._select_row_index(x)
+
+
+def test_block_cyclic_solves(eye33, ones3, allclose):
+    x_approx = kaczmarz.BlockCyclic.solve(eye33, ones3, block_size=2)
+    assert allclose([1, 1, 1], x_approx)
+
+
+def test_block_with_duplicate_rows(allclose):
+    """The block solve should tolerate rank-deficient blocks."""
+    A = np.array([[1, 0], [1, 0], [0, 1]])
+    x_exact = np.array([1, 2])
+    b = A @ x_exact
+    x_approx = kaczmarz.Block.solve(A, b, block_size=3)
+    assert allclose(x_approx, x_exact, rtol=1e-4)
+
+
+def test_block_averaged_solves(eye33, ones3, allclose):
+    x_approx = kaczmarz.BlockAveraged.solve(eye33, ones3, block_size=2, seed=0)
+    assert allclose([1, 1, 1], x_approx)
+
+
+def test_block_averaged_matches_mean_of_projections(eye33, ones3):
+    """One step should add the average of the selected row projections."""
+    solver = kaczmarz.BlockAveraged(eye33, ones3, block_size=2)
+    xk = np.zeros(3)
+    xkp1 = solver._update_iterate(xk, [0, 0])
+    assert [1, 0, 0] == list(xkp1)
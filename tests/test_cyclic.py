@@ -22,6 +22,21 @@ def test_row_indexes(eye23, ones2):
         next(iterator)
 
 
+def test_compiled_solve(eye23, ones2, allclose):
+    """The compiled fast path of ``solve`` should agree with the iteration."""
+    assert allclose([1, 1, 0], kaczmarz.Cyclic.solve(eye23, ones2))
+    assert allclose([1, 1, 0], kaczmarz.Cyclic.solve(eye23, ones2, order=[1, 0]))
+    assert allclose([1, 0, 0], kaczmarz.Cyclic.solve(eye23, ones2, tol=None, maxiter=1))
+
+    # A user callback forces the per-iteration Python path.
+    actual_iterates = []
+    x = kaczmarz.Cyclic.solve(
+        eye23, ones2, callback=lambda xk: actual_iterates.append(xk)
+    )
+    assert allclose([1, 1, 0], x)
+    assert len(actual_iterates) > 0
+
+
 def test_ordered_cyclic(eye23, ones2):
     x = np.zeros(3)
     cyclic = kaczmarz.Cyclic(eye23, ones2, order=[1, 0])
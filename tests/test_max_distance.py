@@ -46,3 +46,21 @@ def test_simple_cases():
     next(iterator)
     next(iterator)
     assert 1 == iterates.ik
+
+
+def test_compiled_solve(allclose):
+    """The compiled fast path of ``solve`` should agree with the iteration."""
+    A = [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+    ]
+    b = [1, 2, 3]
+    assert allclose([1, 2, 3], kaczmarz.MaxDistance.solve(A, b))
+    assert allclose([0, 0, 3], kaczmarz.MaxDistance.solve(A, b, tol=None, maxiter=1))
+
+    # A user callback forces the per-iteration Python path.
+    actual_iterates = []
+    x = kaczmarz.MaxDistance.solve(A, b, callback=lambda xk: actual_iterates.append(xk))
+    assert allclose([1, 2, 3], x)
+    assert len(actual_iterates) > 0
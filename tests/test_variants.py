@@ -8,16 +8,24 @@ import kaczmarz
 
 np.random.seed(0)
 
-strategies = []
-for name in dir(kaczmarz):
-    if name.startswith("_"):
-        continue
-    attr = getattr(kaczmarz, name)
-    if attr == kaczmarz.Base:
-        continue
-    if not issubclass(attr, kaczmarz.Base):
-        continue
-    strategies.append(attr)
+# Built once at import so collecting the parametrized cross-product
+# below does not repeat the reflection over the kaczmarz namespace.
+strategies = tuple(
+    attr
+    for attr in (getattr(kaczmarz, name) for name in dir(kaczmarz))
+    if isinstance(attr, type)
+    and attr is not kaczmarz.Base
+    and issubclass(attr, kaczmarz.Base)
+)
+
+
+def test_strategies_registry():
+    """The registry should expose every strategy and reject mutation."""
+    registry = kaczmarz.strategies()
+    assert registry["Cyclic"] is kaczmarz.Cyclic
+    assert set(registry.values()) == set(strategies)
+    with pytest.raises(TypeError):
+        registry["Cyclic"] = None
 
 
 def orthogonal_rows():
@@ -102,52 +110,72 @@ def overdetermined():
     return examples
 
 
-systems = orthogonal_rows() + underdetermined() + overdetermined()
+def materialize(A, x):
+    """Precompute the representations and invariants shared by the tests."""
+    x_exact = np.asarray(x, dtype=np.float64)
+    Anp = np.array(A)
+    Asp = sp.csr_matrix(A)
+    b = Anp @ x_exact
+    row_norms = np.linalg.norm(A, axis=1)
+    return A, Anp, Asp, b, row_norms, 1.0 / row_norms, x_exact
+
+
+# Materialized once at import, so the array and csr conversions are not
+# repeated for every strategy in the parametrized cross-product.
+systems = tuple(
+    materialize(A, x)
+    for A, x in orthogonal_rows() + underdetermined() + overdetermined()
+)
 
 
-@pytest.mark.parametrize("A,x_exact", systems)
+def normalized_error(Anp, x_approx, x_exact, inv_row_norms):
+    """Residual norm of the normalized system, without broadcast temporaries."""
+    residual = Anp @ (x_approx - x_exact)
+    residual *= inv_row_norms
+    return np.linalg.norm(residual)
+
+
+# Positions of the input representations within a system bundle.
+input_kinds = {"list": 0, "ndarray": 1, "csr": 2}
+
+
+@pytest.mark.parametrize("input_kind", input_kinds)
+@pytest.mark.parametrize("system", systems)
 @pytest.mark.parametrize("Strategy", strategies)
-def test_solve(A, x_exact, Strategy, allclose):
+def test_solve(system, Strategy, input_kind, allclose):
     """Solvers should accept list-of-lists, np.ndarray, and csr_matrix."""
-    row_norms = np.linalg.norm(A, axis=1)
+    A, Anp, Asp, b, row_norms, inv_row_norms, x_exact = system
     tol = 1e-5
-    Anp = np.array(A)
-    Asp = sp.csr_matrix(A)
-    b = Anp @ x_exact
-    x_approx = Strategy.solve(A, b, tol=tol)
-    assert np.linalg.norm(Anp @ (x_approx - x_exact) / row_norms) < tol
-    assert allclose(x_approx, x_exact, rtol=10 * tol)
-    x_approx = Strategy.solve(Anp, b, tol=tol)
-    assert np.linalg.norm(Anp @ (x_approx - x_exact) / row_norms) < tol
-    assert allclose(x_approx, x_exact, rtol=10 * tol)
-    x_approx = Strategy.solve(Asp, b, tol=tol)
-    assert np.linalg.norm(Anp @ (x_approx - x_exact) / row_norms) < tol
+    x_approx = Strategy.solve(system[input_kinds[input_kind]], b, tol=tol)
+    assert normalized_error(Anp, x_approx, x_exact, inv_row_norms) < tol
     assert allclose(x_approx, x_exact, rtol=10 * tol)
 
 
-@pytest.mark.parametrize("A,x_exact", systems)
+@pytest.mark.parametrize("system", systems)
 @pytest.mark.parametrize("Strategy", strategies)
-def test_iterates_converge_monotonically(A, x_exact, Strategy):
+def test_iterates_converge_monotonically(system, Strategy):
     """Check that solver works on list-of-lists, np.ndarray, and csr_matrix."""
-    Anp = np.array(A)
-    b = Anp @ x_exact
-    errors = [np.linalg.norm(xk - x_exact) for xk in Strategy.iterates(Anp, b)]
+    A, Anp, Asp, b, row_norms, inv_row_norms, x_exact = system
+    iterates = np.array(list(Strategy.iterates(Anp, b)))
+    errors = np.linalg.norm(iterates - x_exact, axis=1).tolist()
     assert errors[1:] <= errors[:-1]
 
 
-@pytest.mark.parametrize("A,x_exact", systems)
-@pytest.mark.parametrize("Strategy", strategies)
-def test_with_nonuniform_probabilities(A, x_exact, Strategy, allclose):
-    """Solvers should accept list-of-lists, np.ndarray, and csr_matrix."""
-    if "p" not in signature(Strategy).parameters:
-        return
+# Strategies that accept nonuniform row probabilities, filtered once at
+# collection so the others do not generate no-op test cases.
+p_strategies = tuple(
+    Strategy for Strategy in strategies if "p" in signature(Strategy).parameters
+)
 
-    A = np.array(A)
-    row_norms = np.linalg.norm(A, axis=1)
+
+@pytest.mark.parametrize("system", systems)
+@pytest.mark.parametrize("Strategy", p_strategies)
+def test_with_nonuniform_probabilities(system, Strategy, allclose):
+    """Solvers should accept list-of-lists, np.ndarray, and csr_matrix."""
+    A, Anp, Asp, b, row_norms, inv_row_norms, x_exact = system
     squared_row_norms = row_norms ** 2
     p = squared_row_norms / squared_row_norms.sum()
     tol = 1e-5
-    b = A @ x_exact
-    x_approx = Strategy.solve(A, b, tol=tol, p=p)
-    assert np.linalg.norm(A @ (x_approx - x_exact) / row_norms) < tol
+    x_approx = Strategy.solve(Anp, b, tol=tol, p=p)
+    assert normalized_error(Anp, x_approx, x_exact, inv_row_norms) < tol
     assert allclose(x_approx, x_exact, rtol=10 * tol)